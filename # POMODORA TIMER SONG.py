@@ -1,6 +1,14 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import threading
+import time
+import math
+import re
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
 
 try:
     from playsound import playsound
@@ -13,6 +21,9 @@ SHORT_BREAK = 5 * 60
 LONG_BREAK = 15 * 60
 ALARM_SOUND = "C:\\Users\\INDURBABU\\Music\\Deva Deva.mp3"
 
+# Custom time input: "minutes", "mm:ss" or "hh:mm:ss"
+TIME_RE = re.compile(r'^(?:(\d+):)?(?:(\d+):)?(\d+)$')
+
 PRIMARY_BG = "#22223b"
 TIMER_BG = "#4a4e69"
 BTN_START = "#38b000"
@@ -21,6 +32,9 @@ BTN_RESET = "#f94144"
 TIMER_FG = "#f2e9e4"
 STATUS_FG = "#9a8c98"
 
+# Pre-formatted "mm:ss" strings for every second of an hour
+MMSS_TABLE = [f"{m:02}:{s:02}" for m in range(60) for s in range(60)]
+
 class PomodoroTimer:
     def __init__(self, root):
         self.root = root
@@ -32,16 +46,32 @@ class PomodoroTimer:
         self.time_left = WORK_TIME
         self.running = False
         self.is_work = True
+        self.pending_after = None
+        self.end_time = None
 
         # Timer display
         self.timer_frame = tk.Frame(root, bg=TIMER_BG, bd=0, relief="flat")
         self.timer_frame.place(relx=0.5, rely=0.23, anchor="center", relwidth=0.85, relheight=0.32)
+        self.time_var = tk.StringVar(value=self.format_time(self.time_left))
         self.timer_label = tk.Label(
-            self.timer_frame, text=self.format_time(self.time_left),
+            self.timer_frame, textvariable=self.time_var,
             font=("Courier New", 48, "bold"), fg=TIMER_FG, bg=TIMER_BG
         )
         self.timer_label.pack(expand=True, fill="both")
 
+        # Button styles, configured once and shared by name
+        # (the native themes ignore button colours, so use "clam")
+        style = ttk.Style(root)
+        style.theme_use("clam")
+        style.configure("Timer.TButton", foreground="white", borderwidth=0, focusthickness=0)
+        style.configure("Custom.Timer.TButton", font=("Arial", 12, "bold"), width=3, background="#3a86ff")
+        style.map("Custom.Timer.TButton", background=[("active", "#4361ee")])
+        for name, bg, active in (("Start", BTN_START, "#70e000"),
+                                 ("Pause", BTN_PAUSE, "#f9844a"),
+                                 ("Reset", BTN_RESET, "#f3722c")):
+            style.configure(f"{name}.Timer.TButton", font=("Arial", 14, "bold"), width=5, padding=(0, 12), background=bg)
+            style.map(f"{name}.Timer.TButton", background=[("active", active)])
+
         # Status
         self.status_label = tk.Label(
             root, text="Ready", font=("Arial", 14, "bold"),
@@ -54,9 +84,8 @@ class PomodoroTimer:
         self.custom_frame.place(relx=0.5, rely=0.62, anchor="center")
         self.custom_entry = tk.Entry(self.custom_frame, width=7, font=("Arial", 13), justify='center', bd=1, relief="solid")
         self.custom_entry.grid(row=0, column=0, padx=(0, 5))
-        self.set_custom_btn = tk.Button(
-            self.custom_frame, text="⏱", command=self.set_custom_time,
-            width=3, font=("Arial", 12, "bold"), bg="#3a86ff", fg="white", bd=0, activebackground="#4361ee"
+        self.set_custom_btn = ttk.Button(
+            self.custom_frame, text="⏱", command=self.set_custom_time, style="Custom.Timer.TButton"
         )
         self.set_custom_btn.grid(row=0, column=1)
 
@@ -64,24 +93,21 @@ class PomodoroTimer:
         self.btn_frame = tk.Frame(root, bg=PRIMARY_BG)
         self.btn_frame.place(relx=0.5, rely=0.78, anchor="center")
 
-        self.start_btn = tk.Button(
+        self.start_btn = ttk.Button(
             self.btn_frame, text="▶", command=self.start_timer,
-            width=5, height=2, font=("Arial", 14, "bold"),
-            bg=BTN_START, fg="white", bd=0, activebackground="#70e000", cursor="hand2"
+            style="Start.Timer.TButton", cursor="hand2"
         )
         self.start_btn.grid(row=0, column=0, padx=8)
 
-        self.pause_btn = tk.Button(
+        self.pause_btn = ttk.Button(
             self.btn_frame, text="⏸", command=self.pause_timer,
-            width=5, height=2, font=("Arial", 14, "bold"),
-            bg=BTN_PAUSE, fg="white", bd=0, activebackground="#f9844a", cursor="hand2"
+            style="Pause.Timer.TButton", cursor="hand2"
         )
         self.pause_btn.grid(row=0, column=1, padx=8)
 
-        self.reset_btn = tk.Button(
+        self.reset_btn = ttk.Button(
             self.btn_frame, text="⟲", command=self.reset_timer,
-            width=5, height=2, font=("Arial", 14, "bold"),
-            bg=BTN_RESET, fg="white", bd=0, activebackground="#f3722c", cursor="hand2"
+            style="Reset.Timer.TButton", cursor="hand2"
         )
         self.reset_btn.grid(row=0, column=2, padx=8)
 
@@ -94,41 +120,61 @@ class PomodoroTimer:
         )
         self.sound_check.place(relx=0.93, rely=0.05, anchor="ne")
 
+        # Alarm sound, decoded once so each alarm only has to start playback
+        self.alarm = self.load_alarm()
+
+    def load_alarm(self):
+        if pygame is None:
+            return None
+        try:
+            pygame.mixer.init()
+            return pygame.mixer.Sound(ALARM_SOUND)
+        except Exception:
+            return None
+
     def format_time(self, secs):
-        mins, secs = divmod(secs, 60)
-        hrs, mins = divmod(mins, 60)
-        if hrs > 0:
-            return f"{hrs:02}:{mins:02}:{secs:02}"
+        if secs < 3600:
+            return MMSS_TABLE[secs]
         else:
-            return f"{mins:02}:{secs:02}"
+            return f"{secs // 3600:02}:" + MMSS_TABLE[secs % 3600]
 
     def set_custom_time(self):
         value = self.custom_entry.get().strip()
         try:
-            if ':' in value:
-                parts = value.split(':')
-                if len(parts) == 2:
-                    mins, secs = map(int, parts)
-                    total = mins * 60 + secs
-                elif len(parts) == 3:
-                    hrs, mins, secs = map(int, parts)
-                    total = hrs * 3600 + mins * 60 + secs
-                else:
-                    raise ValueError
+            match = TIME_RE.match(value)
+            if not match:
+                raise ValueError
+            first, second, last = match.groups()
+            if first is None:
+                total = int(last) * 60
+            elif second is None:
+                total = int(first) * 60 + int(last)
             else:
-                total = int(value) * 60
+                total = int(first) * 3600 + int(second) * 60 + int(last)
             if total <= 0:
                 raise ValueError
             self.time_left = total
             self.is_work = True
-            self.timer_label.config(text=self.format_time(self.time_left))
+            self.time_var.set(self.format_time(self.time_left))
+            if self.running:
+                # Restart the running countdown from the new time
+                self.end_time = time.monotonic() + total
+                if self.pending_after is not None:
+                    self.root.after_cancel(self.pending_after)
+                    self.pending_after = None
+                self.update_timer()
             self.status_label.config(text="Custom timer set!", fg="#3a86ff")
         except Exception:
             messagebox.showerror("Invalid Input", "Enter time as mm:ss or hh:mm:ss or just minutes.")
 
     def start_timer(self):
         if not self.running and self.time_left > 0:
+            # Drop a tick left over from before a pause so only one loop runs
+            if self.pending_after is not None:
+                self.root.after_cancel(self.pending_after)
+                self.pending_after = None
             self.running = True
+            self.end_time = time.monotonic() + self.time_left
             self.status_label.config(
                 text="Working..." if self.is_work else "Break!",
                 fg=BTN_START if self.is_work else BTN_PAUSE
@@ -136,13 +182,19 @@ class PomodoroTimer:
             self.update_timer()
 
     def update_timer(self):
-        if self.running and self.time_left > 0:
-            self.timer_label.config(text=self.format_time(self.time_left))
-            self.time_left -= 1
-            self.root.after(1000, self.update_timer)
-        elif self.time_left == 0 and self.running:
-            self.running = False
-            self.timer_label.config(text=self.format_time(0))
+        if not self.running:
+            return
+        remaining = self.end_time - time.monotonic()
+        if remaining > 0:
+            self.time_left = math.ceil(remaining)
+            self.time_var.set(self.format_time(self.time_left))
+            # Wake up again exactly when the displayed second changes
+            delay_ms = math.ceil((remaining - (self.time_left - 1)) * 1000)
+            self.pending_after = self.root.after(delay_ms, self.update_timer)
+        else:
+            self.pending_after = None
+            self.time_left = 0
+            self.time_var.set(self.format_time(0))
             if self.sound_var.get():
                 self.play_sound()
             if self.is_work:
@@ -152,9 +204,13 @@ class PomodoroTimer:
                 self.status_label.config(text="Back to work!", fg=BTN_START)
                 self.time_left = WORK_TIME
             self.is_work = not self.is_work
-            self.start_timer()
+            # Roll straight into the next phase; the timer keeps running
+            self.end_time = time.monotonic() + self.time_left
+            self.update_timer()
 
     def pause_timer(self):
+        if self.running:
+            self.time_left = max(0, math.ceil(self.end_time - time.monotonic()))
         self.running = False
         self.status_label.config(text="Paused", fg=BTN_PAUSE)
 
@@ -162,11 +218,14 @@ class PomodoroTimer:
         self.running = False
         self.time_left = WORK_TIME
         self.is_work = True
-        self.timer_label.config(text=self.format_time(self.time_left))
+        self.time_var.set(self.format_time(self.time_left))
         self.status_label.config(text="Ready", fg=STATUS_FG)
 
     def play_sound(self):
-        threading.Thread(target=lambda: playsound(ALARM_SOUND), daemon=True).start()
+        if self.alarm is not None:
+            self.alarm.play()
+        else:
+            threading.Thread(target=lambda: playsound(ALARM_SOUND), daemon=True).start()
 
 if __name__ == "__main__":
     root = tk.Tk()
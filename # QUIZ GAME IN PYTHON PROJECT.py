@@ -4,19 +4,18 @@ def new_game():
     
     guesses = []
     correct_guesses = 0
-    question_num = 1
     
-    for key in questions:
+    for question, choices, answer in QUIZ:
         print("--------------------------------------------")
-        print(key)
-        for i in options[question_num-1]:
+        print(question)
+        for i in choices:
             print(i)
         guess = input("Enter an option(A, B, C, D ): ")
-        guess = guess.upper()
+        guess = guess[:1].upper()
         guesses.append(guess)
         
-    check_guesses = check_answer(questions.get(key), guess)
-    question_num += 1
+        if check_answer(answer, guess):
+            correct_guesses += 1
         
     display_score(correct_guesses, guesses)
         
@@ -34,40 +33,33 @@ def display_score(correct_guesses, guesses):
     print("RESULTS")
     print("------------------------")
     
-    print("Answers: ", end="")
-    for i in questions:
-        print(questions.get(i), end=" ")
-    print()
+    print("Answers:", *(answer for question, choices, answer in QUIZ))
     
-    print("guesses: ", end=" ")
-    for i in guesses:
-        print(i, end="")
-    print()
+    print("guesses: ", "".join(guesses))
     
-    score = int(correct_guesses/len(questions) +100)
+    score = 100 * correct_guesses // TOTAL_Q
     print("Your score is : " +str(score)+ "%")
 #-------------------------------------------
 def play_game():
     
     response = input("Do you want to play again? (yes or No): ")
-    response = response.upper()
     
-    if response == "YES":
-        return True
-    else:
-        return False    
+    # only the first letter matters: "y", "yes", "Yes" all mean play again
+    return response[:1] in ("y", "Y")
 #-------------------------------------------
-questions = {
-    "who created python? ": "A",
-    "Which year python was introduced? ": "B",
-    "python is tributed to which comedy group? ": "C",
-    "is the Earth round? " : "A",
-}
+# each entry is (question, options, correct answer)
+QUIZ = [
+    ("who created python? ",
+     ["A. Guido van rossum", "B. Elon musk", "C. Bill gates", "D. mark zuckerbrug"], "A"),
+    ("Which year python was introduced? ",
+     ["A. 1989", "B. 1991", "c. 2000", "D. 2016"], "B"),
+    ("python is tributed to which comedy group? ",
+     ["A. Lonely island", "B.smosh", "C. monty python", "D. snl"], "C"),
+    ("is the Earth round? ",
+     ["A. True", "B. False", "C. smoetimes", "D.whats Earth"], "A"),
+]
 
-options = [["A. Guido van rossum", "B. Elon musk", "C. Bill gates", "D. mark zuckerbrug"],
-          ["A. 1989", "B. 1991", "c. 2000", "D. 2016"],
-          ["A. Lonely island", "B.smosh", "C. monty python", "D. snl"],
-          ["A. True", "B. False", "C. smoetimes", "D.whats Earth"]]
+TOTAL_Q = len(QUIZ)
 
 new_game()
 
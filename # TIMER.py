@@ -1,5 +1,10 @@
 import tkinter as tk
 from tkinter import messagebox
+import time
+import math
+
+# Pre-formatted "MM:SS" strings for every second of an hour
+MMSS_TABLE = [f"{m:02d}:{s:02d}" for m in range(60) for s in range(60)]
 
 class StudyTimer:
     def __init__(self, root):
@@ -10,6 +15,8 @@ class StudyTimer:
 
         self.time_left = 0
         self.running = False
+        self.pending_after = None
+        self.end_time = None
 
         # Entry for input
         self.label = tk.Label(root, text="Enter Time (HH:MM:SS)", font=("Arial", 12))
@@ -19,7 +26,8 @@ class StudyTimer:
         self.entry.pack(pady=5)
 
         # Timer display
-        self.timer_label = tk.Label(root, text="00:00:00", font=("Courier", 36), fg="green")
+        self.time_var = tk.StringVar(value="00:00:00")
+        self.timer_label = tk.Label(root, textvariable=self.time_var, font=("Courier", 36), fg="green")
         self.timer_label.pack(pady=20)
 
         # Buttons
@@ -43,21 +51,32 @@ class StudyTimer:
                 self.time_left = h * 3600 + m * 60 + s
                 if self.time_left <= 0:
                     raise ValueError
+                # Drop a tick left over from before a pause so only one loop runs
+                if self.pending_after is not None:
+                    self.root.after_cancel(self.pending_after)
+                    self.pending_after = None
                 self.running = True
+                self.end_time = time.monotonic() + self.time_left
                 self.update_timer()
             except Exception:
                 messagebox.showerror("Invalid Input", "Please enter time in HH:MM:SS format and make sure it's positive.")
 
     def update_timer(self):
-        if self.running and self.time_left > 0:
-            mins, secs = divmod(self.time_left, 60)
-            hours, mins = divmod(mins, 60)
-            time_format = f"{hours:02d}:{mins:02d}:{secs:02d}"
-            self.timer_label.config(text=time_format)
-            self.time_left -= 1
-            self.root.after(1000, self.update_timer)
-        elif self.time_left == 0 and self.running:
-            self.timer_label.config(text="00:00:00")
+        if not self.running:
+            return
+        remaining = self.end_time - time.monotonic()
+        if remaining > 0:
+            self.time_left = math.ceil(remaining)
+            hours, rest = divmod(self.time_left, 3600)
+            time_format = f"{hours:02d}:" + MMSS_TABLE[rest]
+            self.time_var.set(time_format)
+            # Wake up again exactly when the displayed second changes
+            delay_ms = math.ceil((remaining - (self.time_left - 1)) * 1000)
+            self.pending_after = self.root.after(delay_ms, self.update_timer)
+        else:
+            self.pending_after = None
+            self.time_left = 0
+            self.time_var.set("00:00:00")
             self.running = False
             messagebox.showinfo("Time's up!", "Your study session is over!")
 
@@ -67,7 +86,7 @@ class StudyTimer:
     def reset_timer(self):
         self.running = False
         self.time_left = 0
-        self.timer_label.config(text="00:00:00")
+        self.time_var.set("00:00:00")
         self.entry.delete(0, tk.END)
 
 # Run the app
@@ -36,14 +36,22 @@ import json
 import os
 import sys
 import argparse
+import threading
 import time
+import heapq
+import bisect
+import re
+from collections import defaultdict
+from types import MappingProxyType
 
-# Try importing tkinter; if not available, GUI won't run.
+# tkinter is imported lazily by load_gui() so console runs don't pay for loading Tk.
+tk = ttk = simpledialog = messagebox = None
+
+# orjson is a faster drop-in for reading/writing the JSON files; stdlib json is the fallback
 try:
-    import tkinter as tk
-    from tkinter import ttk, simpledialog, messagebox
+    import orjson
 except Exception:
-    tk = None
+    orjson = None
 
 # winsound for beep on Windows; otherwise fallback to tk bell or no-sound
 try:
@@ -64,6 +72,14 @@ BUILTIN_CATEGORIES = {
     "common": ["hangman", "program", "keyboard", "network", "science", "education"],
 }
 
+# A playable word: lowercase letters and apostrophes, with at least one letter.
+# Shared by the words file loader and the two-player secret entry.
+_WORD_PATTERN = r"[a-z']*[a-z][a-z']*"
+_WORD_RE = re.compile(rf"\A{_WORD_PATTERN}\Z")
+# One line of the words file: optional "category:" prefix, then a word
+# (matched against the lowercased line, so it accepts exactly what _WORD_RE accepts)
+_WORD_LINE_RE = re.compile(rf"^(?:([^:]*):)?\s*({_WORD_PATTERN})$")
+
 # Difficulty presets: name -> (lives, score_multiplier)
 DIFFICULTY = {
     "Easy": (8, 0.8),
@@ -76,26 +92,72 @@ MAX_STAGES = 8
 
 # ----------------------------- Utilities -----------------------------
 
-def play_beep():
-    """Cross-platform beep: tries winsound, else Tk bell if available."""
-    try:
-        if winsound:
+def _beep_winsound():
+    """Beep via winsound on a background thread (Beep blocks for its whole duration)."""
+    def beep():
+        try:
             winsound.Beep(750, 120)  # freq, duration
-        elif tk:
-            # create a temporary root to ring bell if none exists
-            try:
-                tk._default_root.bell()
-            except Exception:
-                # fallback: print bell char
-                print("\a", end="")
-        else:
-            print("\a", end="")
+        except Exception:
+            pass
+    threading.Thread(target=beep, daemon=True).start()
+
+def _beep_bell():
+    """Ring the Tk bell of the running app (tk is only loaded in GUI mode)."""
+    try:
+        tk._default_root.bell()
     except Exception:
-        pass
+        # fallback: print bell char
+        print("\a", end="")
+
+# Cross-platform beep: winsound, else Tk bell if available; picked once at import
+if winsound:
+    play_beep = _beep_winsound
+else:
+    play_beep = _beep_bell
 
 def now_timestamp():
     return int(time.time())
 
+# Formatted leaderboard timestamps; saved scores never change, so each one is formatted once
+_TS_CACHE = {}
+
+def format_timestamp(ts):
+    """Format a saved score time; None (no time recorded) shows the current time, uncached."""
+    if ts is None:
+        return time.strftime("%Y-%m-%d %H:%M", time.localtime(now_timestamp()))
+    text = _TS_CACHE.get(ts)
+    if text is None:
+        text = _TS_CACHE[ts] = time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+    return text
+
+def _read_json(path):
+    """Read and parse a JSON file (orjson if available, else stdlib json)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _write_json(path, obj):
+    """Serialize obj as indented JSON and atomically replace path with it."""
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    # write a temp file first so a crash never leaves a half-written file behind
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except Exception:
+        # don't leave a stray temp file behind when the save fails
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
 # ----------------------------- Word Loading -----------------------------
 
 def load_words_with_categories(filepath=DEFAULT_WORDS_FILE):
@@ -104,55 +166,51 @@ def load_words_with_categories(filepath=DEFAULT_WORDS_FILE):
     File format:
       category:word
       word   (goes into 'default' category)
-    Returns: dict category -> list(words)
+    Returns: read-only mapping category -> tuple(words)
     """
-    cats = {}
+    cats = defaultdict(set)
     if os.path.exists(filepath):
         try:
             with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    s = line.strip()
-                    if not s:
-                        continue
-                    if ":" in s:
-                        cat, word = s.split(":", 1)
-                        cat = cat.strip().lower()
-                        word = word.strip().lower()
-                    else:
-                        cat = "default"
-                        word = s.strip().lower()
-                    # keep only alphabetic words or words with apostrophe
-                    if all(ch.isalpha() or ch == "'" for ch in word):
-                        cats.setdefault(cat, []).append(word)
+                lines = f.read().splitlines()
+            for line in lines:
+                # keep only alphabetic words or words with apostrophe
+                m = _WORD_LINE_RE.match(line.strip().lower())
+                if not m:
+                    continue
+                cat, word = m.groups()
+                cat = "default" if cat is None else cat.strip()
+                cats[cat].add(word)
         except Exception:
             pass
     # Merge builtin categories for fallback and add default if none
     for k, v in BUILTIN_CATEGORIES.items():
-        cats.setdefault(k, []).extend([w.lower() for w in v])
+        cats[k].update(w.lower() for w in v)
     if "default" not in cats:
-        cats.setdefault("default", ["python", "hangman", "program"])
-    # Remove duplicates and ensure lists are non-empty
-    for k in list(cats.keys()):
-        cats[k] = sorted(set(cats[k]))
-        if not cats[k]:
-            del cats[k]
-    return cats
+        cats["default"].update(["python", "hangman", "program"])
+    # Sort each category's words (sets already removed duplicates); nothing mutates them later
+    return MappingProxyType({k: tuple(sorted(v)) for k, v in cats.items() if v})
 
 # ----------------------------- Leaderboard (persistent) -----------------------------
 
+# In-memory copy of the leaderboard; read from disk once, then kept in sync by save_scores
+_SCORES_CACHE = None
+
 def load_scores():
-    if not os.path.exists(SCORES_FILE):
-        return []
+    global _SCORES_CACHE
+    if _SCORES_CACHE is not None:
+        return _SCORES_CACHE
     try:
-        with open(SCORES_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return []
+        _SCORES_CACHE = _read_json(SCORES_FILE)
+    except Exception:  # includes FileNotFoundError on first run
+        _SCORES_CACHE = []
+    return _SCORES_CACHE
 
 def save_scores(scores):
+    global _SCORES_CACHE
+    _SCORES_CACHE = scores
     try:
-        with open(SCORES_FILE, "w", encoding="utf-8") as f:
-            json.dump(scores, f, indent=2)
+        _write_json(SCORES_FILE, scores)
     except Exception:
         pass
 
@@ -166,100 +224,169 @@ def add_score(name, score, difficulty, category):
         "time": now_timestamp()
     })
     # keep only top 50
-    scores = sorted(scores, key=lambda x: x["score"], reverse=True)[:50]
+    scores = heapq.nlargest(50, scores, key=lambda x: x["score"])
     save_scores(scores)
 
 # ----------------------------- Save & Resume -----------------------------
 
 def save_game_state(state):
     try:
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2)
+        _write_json(SAVE_FILE, state)
     except Exception:
         pass
 
 def load_game_state():
-    if not os.path.exists(SAVE_FILE):
-        return None
     try:
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        return _read_json(SAVE_FILE)
+    except Exception:  # includes FileNotFoundError when there is no save
         return None
 
 def clear_save():
     try:
-        if os.path.exists(SAVE_FILE):
-            os.remove(SAVE_FILE)
-    except Exception:
+        os.remove(SAVE_FILE)
+    except OSError:  # includes FileNotFoundError when there is no save
         pass
 
 # ----------------------------- Core Game Logic -----------------------------
 
+def _letter_bit(ch):
+    """Bit for a lowercase letter a-z in a 26-bit letter mask."""
+    return 1 << (ord(ch) - 97)
+
+def _mask_letters(mask):
+    """Letters whose bits are set in mask, in alphabetical order."""
+    return [chr(97 + i) for i in range(26) if mask >> i & 1]
+
 class HangmanGame:
     """
     Simple portable representation of a hangman game state. Works for both Console and GUI.
+    Guessed and wrong letters are kept as 26-bit masks (bit 0 = 'a').
     """
+    # fixed attribute set: no per-instance __dict__, faster attribute access on every guess/redraw
+    __slots__ = (
+        "secret", "_secret_mask", "_unique_count", "lives", "_guessed_mask", "_wrong_mask",
+        "_wrong_sorted", "_wrong_str", "hints_used", "_hint_penalty", "started_at",
+        "difficulty", "category", "base_score", "finished", "won", "_mask", "_mask_guessed",
+    )
+
     def __init__(self, secret_word, lives, difficulty_name="Normal", category="default"):
         self.secret = secret_word.lower()
+        # letters to guess; apostrophes (anything outside a-z) are shown from the start
+        self._secret_mask = 0
+        for c in self.secret:
+            if "a" <= c <= "z":
+                self._secret_mask |= _letter_bit(c)
+        self._unique_count = bin(self._secret_mask).count("1")
         self.lives = lives
-        self.guessed = set()
-        self.wrong = set()
+        self._guessed_mask = 0  # correct letters and hint reveals
+        self._wrong_mask = 0
+        self._wrong_sorted = []  # wrong letters kept in order for display
+        self._wrong_str = ""
         self.hints_used = 0
+        self._hint_penalty = 0  # lives lost to hints
         self.started_at = now_timestamp()
         self.difficulty = difficulty_name
         self.category = category
         self.base_score = 0  # computed at end
         self.finished = False
         self.won = False
+        # masked word cache, rebuilt only when the guessed letters change
+        self._mask = None
+        self._mask_guessed = -1
 
     def masked_word(self):
-        return " ".join([c if c in self.guessed else "_" for c in self.secret])
+        if self._mask_guessed != self._guessed_mask:
+            guessed = self._guessed_mask
+            self._mask = " ".join([
+                "_" if "a" <= c <= "z" and not guessed & _letter_bit(c) else c
+                for c in self.secret
+            ])
+            self._mask_guessed = guessed
+        return self._mask
 
     def guess_letter(self, ch):
         ch = ch.lower()
-        if not ch.isalpha() or len(ch) != 1:
+        if len(ch) != 1 or not "a" <= ch <= "z":
             return False, "invalid"
-        if ch in self.guessed or ch in self.wrong:
+        bit = _letter_bit(ch)
+        if (self._guessed_mask | self._wrong_mask) & bit:
             return False, "duplicate"
-        if ch in self.secret:
-            self.guessed.add(ch)
+        if self._secret_mask & bit:
+            self._guessed_mask |= bit
             self._check_win()
             return True, "correct"
         else:
-            self.wrong.add(ch)
+            self._wrong_mask |= bit
+            bisect.insort(self._wrong_sorted, ch)
+            self._wrong_str = " ".join(self._wrong_sorted)
             self._check_lose()
             return False, "incorrect"
 
+    def wrong_letters(self):
+        """Wrong letters guessed so far, sorted and space-separated."""
+        return self._wrong_str
+
     def use_hint(self):
         """Reveal one unrevealed letter and penalize (counts as wrong guess by default)."""
-        unrevealed = [c for c in set(self.secret) if c not in self.guessed]
+        unrevealed = _mask_letters(self._secret_mask & ~self._guessed_mask)
         if not unrevealed:
             return None
         reveal = random.choice(unrevealed)
-        self.guessed.add(reveal)
+        self._guessed_mask |= _letter_bit(reveal)
         self.hints_used += 1
-        # optional penalty: count as a wrong guess (reduces lives)
-        self.wrong.add(f"hint-{self.hints_used}")  # uses synthetic wrong entries for drawing/lives
+        # penalty: costs a life just like a wrong guess
+        self._hint_penalty += 1
         self._check_lose()
         self._check_win()
         return reveal
 
     def remaining_lives(self):
-        # live count is lives - number of 'real' wrong letter guesses (exclude hint markers or count them)
-        # We'll treat any wrong set item that is a single letter as a real wrong guess, and hint-* as a penalty too
-        return self.lives - len(self.wrong)
+        # every wrong letter and every hint costs one life
+        return self.lives - self.mistakes()
+
+    def mistakes(self):
+        """Number of lives lost so far (wrong letters + hints); drives the hangman drawing."""
+        return len(self._wrong_sorted) + self._hint_penalty
 
     def _check_win(self):
-        if all(c in self.guessed for c in self.secret):
+        if self._guessed_mask & self._secret_mask == self._secret_mask:
             self.finished = True
             self.won = True
 
     def _check_lose(self):
-        if len(self.wrong) >= self.lives:
+        if self.mistakes() >= self.lives:
             self.finished = True
             self.won = False
 
+    def to_state(self):
+        """Plain dict of the game state, suitable for save_game_state()."""
+        return {
+            "secret": self.secret,
+            "lives": self.lives,
+            "difficulty": self.difficulty,
+            "category": self.category,
+            "guessed": _mask_letters(self._guessed_mask),
+            "wrong": list(self._wrong_sorted),
+            "hints_used": self.hints_used,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a game from a dict produced by to_state() (or an older save file)."""
+        game = cls(state["secret"], state["lives"], state.get("difficulty", "Normal"), state.get("category", "default"))
+        # only single a-z letters count; older saves also recorded each hint as a "hint-N" wrong entry
+        for c in state.get("guessed", []):
+            if len(c) == 1 and "a" <= c <= "z":
+                game._guessed_mask |= _letter_bit(c)
+        for c in state.get("wrong", []):
+            if len(c) == 1 and "a" <= c <= "z":
+                game._wrong_mask |= _letter_bit(c)
+        game._wrong_sorted = _mask_letters(game._wrong_mask)
+        game._wrong_str = " ".join(game._wrong_sorted)
+        game.hints_used = state.get("hints_used", 0)
+        game._hint_penalty = game.hints_used
+        return game
+
     def compute_score(self):
         """
         Score formula (example):
@@ -268,7 +395,7 @@ class HangmanGame:
           penalty = hints_used * 15
           difficulty multiplier applied
         """
-        unique_letters = len(set(self.secret))
+        unique_letters = self._unique_count
         base = unique_letters * 10
         bonus = max(0, self.remaining_lives()) * 5
         penalty = self.hints_used * 15
@@ -280,7 +407,7 @@ class HangmanGame:
 
 # ----------------------------- Console Mode -----------------------------
 
-ASCII_PICS = [
+ASCII_PICS = (
     """
      +---+
      |   |
@@ -346,20 +473,17 @@ ASCII_PICS = [
     / \\  |
          |
     =========""",
-]
+)
+_MAX_ASCII_IDX = len(ASCII_PICS) - 1
 
-def console_play(categories):
+def console_play(categories, category_names):
     print("Welcome to Hangman Pro (Console mode)")
     # Optionally resume saved game
     saved = load_game_state()
     if saved:
         use_saved = input("A saved game was found. Resume? (y/n): ").strip().lower()
         if use_saved in ("y", "yes"):
-            gstate = saved
-            game = HangmanGame(gstate["secret"], gstate["lives"], gstate["difficulty"], gstate.get("category", "default"))
-            game.guessed = set(gstate.get("guessed", []))
-            game.wrong = set(gstate.get("wrong", []))
-            game.hints_used = gstate.get("hints_used", 0)
+            game = HangmanGame.from_state(saved)
             print("Resumed saved game.")
             return _console_loop(game, categories)
 
@@ -369,15 +493,15 @@ def console_play(categories):
         mode = input("Choose mode: (1) Single-player (random word)  (2) Two-player: ").strip()
     if mode == "1":
         # pick category
-        print("Available categories:", ", ".join(sorted(categories.keys())))
+        print("Available categories:", ", ".join(category_names))
         cat = input("Choose category (or press Enter for random): ").strip().lower()
         if not cat or cat not in categories:
-            cat = random.choice(list(categories.keys()))
+            cat = random.choice(category_names)
         secret = random.choice(categories[cat])
     else:
         secret = input("Player 1, enter the secret word (letters only): ").strip().lower()
-        while not secret.isalpha():
-            print("Please enter alphabetic characters only.")
+        while not _WORD_RE.match(secret):
+            print("Please enter letters (and apostrophes) only.")
             secret = input("Player 1, enter the secret word: ").strip().lower()
         cat = "two-player"
 
@@ -408,10 +532,10 @@ def _console_loop(game, categories):
     # Core console loop
     while True:
         print("\n" + ("-"*40))
-        stage = min(len(game.wrong), len(ASCII_PICS)-1)
-        print(ASCII_PICS[stage])
+        stage = game.mistakes()
+        print(ASCII_PICS[stage if stage <= _MAX_ASCII_IDX else _MAX_ASCII_IDX])
         print("Word:", game.masked_word())
-        print(f"Wrong guesses: {' '.join(sorted([w for w in game.wrong if isinstance(w, str) and not w.startswith('hint-')]))}")
+        print(f"Wrong guesses: {game.wrong_letters()}")
         print(f"Lives left: {game.remaining_lives()}   Hints used: {game.hints_used}")
         print("Commands: guess <letter> | hint | save | quit")
         cmd = input("Enter command or letter: ").strip().lower()
@@ -421,16 +545,7 @@ def _console_loop(game, categories):
             break
         if cmd == "save":
             # Save state and exit
-            state = {
-                "secret": game.secret,
-                "lives": game.lives,
-                "difficulty": game.difficulty,
-                "category": game.category,
-                "guessed": list(game.guessed),
-                "wrong": list(game.wrong),
-                "hints_used": game.hints_used,
-            }
-            save_game_state(state)
+            save_game_state(game.to_state())
             print("Game saved to disk. You can resume later.")
             break
         if cmd == "hint":
@@ -482,12 +597,22 @@ def _console_end(game):
 
 # ----------------------------- GUI Mode (Tkinter) -----------------------------
 
-if tk:
+def load_gui():
+    """Import tkinter and define the GUI class. Returns HangmanGUI, or None if Tk is unavailable."""
+    global tk, ttk, simpledialog, messagebox
+    try:
+        import tkinter as tk
+        from tkinter import ttk, simpledialog, messagebox
+    except Exception:
+        tk = None
+        return None
+
     class HangmanGUI(tk.Tk):
-        def __init__(self, categories):
+        def __init__(self, categories, category_names):
             super().__init__()
             self.title("Hangman Pro")
             self.categories = categories
+            self._cat_names = category_names
             self.geometry("640x480")
             self.resizable(False, False)
 
@@ -500,7 +625,7 @@ if tk:
             ttk.Combobox(top, values=["Single", "Two-player"], textvariable=self.mode_var, width=10, state="readonly").pack(side="left", padx=6)
 
             ttk.Label(top, text="Category:").pack(side="left")
-            cats = sorted(self.categories.keys())
+            cats = self._cat_names
             self.cat_var = tk.StringVar(value=cats[0] if cats else "default")
             self.cat_cb = ttk.Combobox(top, values=cats, textvariable=self.cat_var, width=14, state="readonly")
             self.cat_cb.pack(side="left", padx=6)
@@ -518,6 +643,8 @@ if tk:
             # Canvas for drawing hangman
             self.canvas = tk.Canvas(self, width=320, height=320, bg="white")
             self.canvas.pack(side="left", padx=(10,0), pady=10)
+            self.draw_gallows()
+            self._drawn_stage = 0  # body parts currently on the canvas
 
             # Right frame for word, input, status
             right = ttk.Frame(self, padding=10)
@@ -545,9 +672,8 @@ if tk:
             self.message = tk.StringVar(value="")
             ttk.Label(right, textvariable=self.message, foreground="blue").pack(anchor="w", pady=(6,0))
 
-            # keyboard binding for convenience
-            for i in range(26):
-                self.bind(chr(ord('a')+i), self._key_handler)
+            # keyboard binding for convenience (one handler, filtered to letters)
+            self.bind("<Key>", self._key_handler)
 
             # initialize game variable
             self.game = None
@@ -562,10 +688,11 @@ if tk:
 
         def _key_handler(self, event):
             ch = event.char.lower()
-            if ch.isalpha() and len(ch)==1:
-                self.guess_entry.delete(0, tk.END)
-                self.guess_entry.insert(0, ch)
-                self.on_guess()
+            if len(ch) == 1 and "a" <= ch <= "z":
+                if event.widget is self.guess_entry:
+                    # the entry already inserted the letter itself
+                    self.guess_entry.delete(0, tk.END)
+                self._apply_guess(ch)
 
         def try_resume(self):
             saved = load_game_state()
@@ -575,11 +702,7 @@ if tk:
             # confirm
             if not messagebox.askyesno("Resume", "Resume saved game?"):
                 return
-            game = HangmanGame(saved["secret"], saved["lives"], saved.get("difficulty","Normal"), saved.get("category","default"))
-            game.guessed = set(saved.get("guessed", []))
-            game.wrong = set(saved.get("wrong", []))
-            game.hints_used = saved.get("hints_used", 0)
-            self.game = game
+            self.game = HangmanGame.from_state(saved)
             self.update_ui()
             messagebox.showinfo("Resume", "Resumed saved game.")
 
@@ -587,22 +710,21 @@ if tk:
             mode = self.mode_var.get()
             cat = self.cat_var.get()
             if mode == "Two-player":
-                # ask for secret
-                word = simpledialog.askstring("Two-player", "Player 1: Enter secret word (letters only):", show="*")
-                if not word:
-                    return
-                word = word.strip().lower()
-                while not word.isalpha():
-                    messagebox.showinfo("Invalid", "Word must be alphabetic.")
-                    word = simpledialog.askstring("Two-player", "Player 1: Enter secret word (letters only):", show="*")
-                    if word is None:
-                        return
+                # ask for secret; invalid words re-ask in the same dialog
+                prompt = "Player 1: Enter secret word (letters only):"
+                while True:
+                    ok, word = self._prompt("Two-player", prompt, entry_show="*")
                     word = word.strip().lower()
+                    if not ok or not word:
+                        return
+                    if _WORD_RE.match(word):
+                        break
+                    prompt = "Word must be letters (and apostrophes) only.\nPlayer 1: Enter secret word (letters only):"
                 secret = word
             else:
                 # pick from category
                 if cat not in self.categories or not self.categories[cat]:
-                    cat = random.choice(list(self.categories.keys()))
+                    cat = random.choice(self._cat_names)
                 secret = random.choice(self.categories[cat])
 
             # difficulty
@@ -622,14 +744,17 @@ if tk:
             self.message.set("New game started. Good luck!")
 
         def on_guess(self):
-            if not self.game or self.game.finished:
-                self.message.set("Start a new game first.")
-                return
             guess = self.guess_entry.get().strip().lower()
             self.guess_entry.delete(0, tk.END)
             if not guess or len(guess) != 1 or not guess.isalpha():
                 self.message.set("Enter a single letter (a-z).")
                 return
+            self._apply_guess(guess)
+
+        def _apply_guess(self, guess):
+            if not self.game or self.game.finished:
+                self.message.set("Start a new game first.")
+                return
             ok, reason = self.game.guess_letter(guess)
             if ok:
                 self.message.set(f"Good! '{guess}' is in the word.")
@@ -664,8 +789,7 @@ if tk:
             if not self.game:
                 return
             self.word_label.config(text="Word: " + self.game.masked_word())
-            wrong_letters = " ".join(sorted([w for w in self.game.wrong if isinstance(w, str) and not w.startswith("hint-")]))
-            self.wrong_label.config(text="Wrong: " + wrong_letters)
+            self.wrong_label.config(text="Wrong: " + self.game.wrong_letters())
             self.status_label.config(text=f"Lives: {self.game.remaining_lives()}  Hints: {self.game.hints_used}")
             self.draw_hangman()
             if self.game.finished:
@@ -674,41 +798,83 @@ if tk:
                 else:
                     self.message.set("You lost. Try again.")
 
-        def draw_hangman(self):
-            # Clear canvas and draw simple gallows + parts depending on wrong count
-            self.canvas.delete("all")
-            # base
+        def draw_gallows(self):
+            # base; drawn once, body parts are added on top as the game goes on
             self.canvas.create_line(20, 300, 300, 300, width=3)
             self.canvas.create_line(60, 300, 60, 40, width=3)
             self.canvas.create_line(60, 40, 180, 40, width=3)
             self.canvas.create_line(180, 40, 180, 70, width=3)
-            stage = min(len(self.game.wrong), MAX_STAGES)
+
+        def draw_hangman(self):
+            # Draw only the body parts added since the last call, depending on wrong count
+            stage = min(self.game.mistakes(), MAX_STAGES)
+            if stage < self._drawn_stage:
+                # new or resumed game: wipe the body but keep the gallows
+                self.canvas.delete("body_part")
+                self._drawn_stage = 0
+            for part in range(self._drawn_stage + 1, stage + 1):
+                self._draw_part(part)
+            self._drawn_stage = stage
+
+        def _draw_part(self, stage):
+            c = self.canvas
+            tag = "body_part"
             # head
-            if stage >= 1:
-                self.canvas.create_oval(150, 70, 210, 130, width=2)
+            if stage == 1:
+                c.create_oval(150, 70, 210, 130, width=2, tags=tag)
             # body
-            if stage >= 2:
-                self.canvas.create_line(180, 130, 180, 200, width=2)
+            elif stage == 2:
+                c.create_line(180, 130, 180, 200, width=2, tags=tag)
             # left arm
-            if stage >= 3:
-                self.canvas.create_line(180, 150, 150, 180, width=2)
+            elif stage == 3:
+                c.create_line(180, 150, 150, 180, width=2, tags=tag)
             # right arm
-            if stage >= 4:
-                self.canvas.create_line(180, 150, 210, 180, width=2)
+            elif stage == 4:
+                c.create_line(180, 150, 210, 180, width=2, tags=tag)
             # left leg
-            if stage >= 5:
-                self.canvas.create_line(180, 200, 150, 240, width=2)
+            elif stage == 5:
+                c.create_line(180, 200, 150, 240, width=2, tags=tag)
             # right leg
-            if stage >= 6:
-                self.canvas.create_line(180, 200, 210, 240, width=2)
+            elif stage == 6:
+                c.create_line(180, 200, 210, 240, width=2, tags=tag)
             # eyes
-            if stage >= 7:
-                self.canvas.create_line(165, 90, 175, 100, width=2)
-                self.canvas.create_line(165, 100, 175, 90, width=2)
-                self.canvas.create_line(195, 90, 205, 100, width=2)
-                self.canvas.create_line(195, 100, 205, 90, width=2)
-            if stage >= 8:
-                self.canvas.create_arc(160, 105, 200, 125, start=0, extent=180, style=tk.CHORD)
+            elif stage == 7:
+                c.create_line(165, 90, 175, 100, width=2, tags=tag)
+                c.create_line(165, 100, 175, 90, width=2, tags=tag)
+                c.create_line(195, 90, 205, 100, width=2, tags=tag)
+                c.create_line(195, 100, 205, 90, width=2, tags=tag)
+            elif stage == 8:
+                c.create_arc(160, 105, 200, 125, start=0, extent=180, style=tk.CHORD, tags=tag)
+
+        def _prompt(self, title, message, entry_show="", ok_text="OK", cancel_text="Cancel"):
+            """
+            One small dialog with a message, a text entry and two buttons.
+            Waits on a variable (the event loop keeps running) and returns (ok_pressed, text).
+            """
+            win = tk.Toplevel(self)
+            win.title(title)
+            win.transient(self)
+            win.resizable(False, False)
+            choice = tk.StringVar(value="")
+            text = tk.StringVar(value="")
+
+            ttk.Label(win, text=message, padding=(10, 10, 10, 4)).pack(anchor="w")
+            entry = ttk.Entry(win, textvariable=text, show=entry_show, width=24)
+            entry.pack(padx=10, anchor="w")
+            btns = ttk.Frame(win, padding=10)
+            btns.pack()
+            ttk.Button(btns, text=ok_text, command=lambda: choice.set("ok")).pack(side="left", padx=4)
+            ttk.Button(btns, text=cancel_text, command=lambda: choice.set("cancel")).pack(side="left", padx=4)
+            win.bind("<Return>", lambda e: choice.set("ok"))
+            win.bind("<Escape>", lambda e: choice.set("cancel"))
+            win.protocol("WM_DELETE_WINDOW", lambda: choice.set("cancel"))
+
+            entry.focus_set()
+            win.grab_set()
+            self.wait_variable(choice)
+            value = text.get()
+            win.destroy()
+            return choice.get() == "ok", value
 
         def _end_game_prompt(self):
             # Called when game finished
@@ -717,12 +883,12 @@ if tk:
             else:
                 msg = f"You lost. The word was: {self.game.secret}\n"
             score = self.game.compute_score()
-            msg += f"Score: {score}\nSave score to leaderboard?"
-            if messagebox.askyesno("Game Over", msg):
-                name = simpledialog.askstring("Leaderboard", "Enter your name (max 20 chars):")
-                if name:
-                    add_score(name[:20], score, self.game.difficulty, self.game.category)
-                    messagebox.showinfo("Saved", "Score saved to leaderboard.")
+            msg += f"Score: {score}\nEnter your name to save it to the leaderboard (max 20 chars):"
+            ok, name = self._prompt("Game Over", msg, ok_text="Save", cancel_text="Skip")
+            name = name.strip()
+            if ok and name:
+                add_score(name[:20], score, self.game.difficulty, self.game.category)
+                self.message.set("Score saved to leaderboard.")
             # clear saved state after end
             clear_save()
 
@@ -730,29 +896,24 @@ if tk:
             if not self.game:
                 self.destroy()
                 return
-            state = {
-                "secret": self.game.secret,
-                "lives": self.game.lives,
-                "difficulty": self.game.difficulty,
-                "category": self.game.category,
-                "guessed": list(self.game.guessed),
-                "wrong": list(self.game.wrong),
-                "hints_used": self.game.hints_used
-            }
-            save_game_state(state)
+            save_game_state(self.game.to_state())
             messagebox.showinfo("Saved", "Game saved. Exiting now.")
             self.destroy()
 
         def show_leaderboard(self):
             scores = load_scores()
-            text = "Top Scores:\n\n"
-            for i, s in enumerate(scores[:20], start=1):
-                ts = time.strftime("%Y-%m-%d %H:%M", time.localtime(s.get("time", now_timestamp())))
-                text += f"{i}. {s['name']} — {s['score']} pts — {s['difficulty']} — {s['category']} — {ts}\n"
-            if not scores:
+            if scores:
+                lines = ["Top Scores:", ""]
+                for i, s in enumerate(scores[:20], start=1):
+                    ts = format_timestamp(s.get("time"))
+                    lines.append(f"{i}. {s['name']} — {s['score']} pts — {s['difficulty']} — {s['category']} — {ts}")
+                text = "\n".join(lines)
+            else:
                 text = "No scores yet."
             messagebox.showinfo("Leaderboard", text)
 
+    return HangmanGUI
+
 # ----------------------------- Main -----------------------------
 
 def main():
@@ -762,11 +923,14 @@ def main():
     args = parser.parse_args()
 
     categories = load_words_with_categories(args.words)
+    # sorted once here; used for category menus and random picks
+    category_names = tuple(sorted(categories.keys()))
 
-    if args.console or tk is None:
-        console_play(categories)
+    gui = None if args.console else load_gui()
+    if gui is None:
+        console_play(categories, category_names)
     else:
-        app = HangmanGUI(categories)
+        app = gui(categories, category_names)
         app.mainloop()
 
 if __name__ == "__main__":